@@ -4,6 +4,10 @@ from flask_jwt_extended import create_access_token
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
+def create_token_for(user):
+    """Issue a JWT access token carrying the user's admin claim"""
+    return create_access_token(identity=str(user.id), additional_claims={'is_admin': user.is_admin})
+
 @auth_bp.route('/register', methods=['POST'])
 def register():
     data = request.get_json()
@@ -24,7 +28,14 @@ def register():
     db.session.add(user)
     db.session.commit()
     
-    return jsonify({'message': 'User created successfully', 'user': user.to_dict()}), 201
+    response = {'message': 'User created successfully', 'user': user.to_dict()}
+    
+    # Optionally log the new user in right away (saves a separate /login call).
+    # Only a JSON boolean true counts; strings like "false" must not issue a token.
+    if data.get('return_token') is True:
+        response['access_token'] = create_token_for(user)
+    
+    return jsonify(response), 201
 
 @auth_bp.route('/login', methods=['POST'])
 def login():
@@ -38,7 +49,7 @@ def login():
     if not user or not user.check_password(data['password']):
         return jsonify({'error': 'Invalid credentials'}), 401
     
-    access_token = create_access_token(identity=str(user.id), additional_claims={'is_admin': user.is_admin})
+    access_token = create_token_for(user)
     
     return jsonify({
         'access_token': access_token,
@@ -9,47 +9,155 @@ These tests:
 Important:
 Integration tests FAIL if the server is not reachable.
 This prevents CI from passing by skipping integration tests.
+
+Parallel runs (pytest -n auto):
+Session-scoped fixtures run once per xdist worker and all
+usernames are uuid-based, so workers never collide. The only shared
+state is the auth token, which workers reuse via a FileLock-guarded cache.
 """
 
+import base64
+import json
 import os
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from types import SimpleNamespace
 
 import pytest
 import requests
 from dotenv import load_dotenv
-
-load_dotenv()
+from filelock import FileLock
+from requests.adapters import HTTPAdapter
 
 # Allow overriding locally/CI via env var if needed later.
-BASE_URL = os.getenv("BASE_URL", "http://localhost:5000")
+# Resolved once in pytest_configure, before any fixture runs.
+BASE_URL = "http://localhost:5000"
+
+
+def pytest_configure(config):
+    """
+    Loads .env once per (worker) session and caches BASE_URL.
+
+    CI exports BASE_URL directly, so the .env file is only read when it
+    is missing from the environment.
+    """
+    global BASE_URL
+
+    if "BASE_URL" not in os.environ:
+        load_dotenv()
+    BASE_URL = os.getenv("BASE_URL", BASE_URL)
 
 
-def _is_server_up() -> bool:
+class _DefaultTimeoutSession(requests.Session):
     """
-    Minimal health probe used to decide if integration tests should run.
-    We keep timeouts low to fail fast.
+    requests.Session that applies a default timeout to every call.
+    An explicit timeout= (e.g. the short readiness probe) still wins.
     """
-    try:
-        r = requests.get(f"{BASE_URL}/api/health", timeout=2)
-        return r.status_code == 200
-    except requests.RequestException:
-        return False
+
+    def __init__(self, timeout: float = 5):
+        super().__init__()
+        self.default_timeout = timeout
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", self.default_timeout)
+        return super().request(*args, **kwargs)
 
 
 @pytest.fixture(scope="session")
-def require_running_server():
+def http():
     """
-    Integration tests require a running API server.
+    One pooled HTTP session shared by the whole test run.
+
+    Keep-alive lets every request reuse an open TCP (and TLS) connection
+    instead of paying a new handshake per call.
+
+    The API is served over HTTP/1.1 only (Gunicorn / Flask dev server),
+    so an HTTP/2 client would not multiplex anything here. Concurrent
+    calls (see parallel_post) instead draw separate connections from this pool.
+    Every call gets a 5s timeout unless it passes its own.
+    """
+    session = _DefaultTimeoutSession(timeout=5)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+
+def _wait_for_health(
+    session: requests.Session, deadline: float = 10.0
+) -> requests.Response | None:
+    """
+    Polls the health endpoint until the API reports healthy or the deadline passes.
+
+    Each probe uses a short timeout and the wait between probes grows
+    exponentially (capped), so a server that is still booting is picked up
+    as soon as it is ready instead of after a fixed sleep.
+    Returns the healthy Response, or None if the server never came up.
+    """
+    give_up_at = time.monotonic() + deadline
+    delay = 0.05
+    while True:
+        try:
+            r = session.get(f"{BASE_URL}/api/health", timeout=0.5)
+            if r.ok and r.json().get("status") == "healthy":
+                return r
+        except (requests.RequestException, ValueError):
+            pass
+
+        if time.monotonic() + delay > give_up_at:
+            return None
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
+@pytest.fixture(scope="session")
+def health_response(http) -> requests.Response:
+    """
+    The healthy /api/health Response from the readiness probe.
 
     - In CI we must not "pass" by skipping integration tests.
     - Failing here guarantees that a missing/unhealthy server breaks the build.
-    - Unit tests remain independent because they do not use this fixture.
+    - The health test asserts on this Response instead of requesting it again.
     """
-    if not _is_server_up():
+    r = _wait_for_health(http)
+    if r is None:
         pytest.fail(
             f"Events API not reachable at {BASE_URL}. "
             "Start the server (python app.py) or run the Docker container and re-run pytest."
         )
+    return r
+
+
+@pytest.fixture(scope="session")
+def require_running_server(health_response):
+    """
+    Integration tests require a running API server.
+    Unit tests remain independent because they do not use this fixture.
+    """
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    One in-process Flask app shared by every test that needs an app context.
+
+    create_app() registers blueprints, sets up extensions and creates tables,
+    so it is built once per session. The database points at in-memory
+    SQLite so unit tests never touch events.db. wsgi.py is left untouched
+    for Gunicorn. Use it as: with app.app_context(): ...
+    """
+    from app import create_app
+    from config import Config
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Config, "SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+        flask_app = create_app()
+    return flask_app
 
 
 @pytest.fixture()
@@ -61,54 +169,190 @@ def unique_username() -> str:
     return f"user_{uuid.uuid4().hex[:12]}"
 
 
+@pytest.fixture(scope="module")
+def fast_password_hashing():
+    """
+    Swaps the KDF used by models.User for a single-iteration PBKDF2.
+
+    Unit tests only check that a hash is stored and round-trips, not its
+    strength. User.set_password/check_password still run unchanged; only the
+    werkzeug hash method they call becomes cheap. Module-scoped: the patch
+    is undone when the requesting test module finishes, so it never leaks
+    into other modules (e.g. tests using the in-process app).
+    """
+    import models
+    from werkzeug.security import generate_password_hash
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            models,
+            "generate_password_hash",
+            partial(generate_password_hash, method="pbkdf2:sha256:1"),
+        )
+        yield
+
+
+@pytest.fixture(scope="module")
+def hashed_user(fast_password_hashing):
+    """
+    A User whose password ("secret123") has been hashed once per test module.
+
+    Hashed under fast_password_hashing, so this is a single-iteration PBKDF2
+    call; sharing it mainly keeps every test on the same known hash.
+    Do not mutate it; use hashed_user_copy.
+    """
+    from models import User
+
+    user = User(username="alice")
+    user.set_password("secret123")
+    return user
+
+
 @pytest.fixture()
+def hashed_user_copy(hashed_user):
+    """
+    Fresh User per test that reuses the module's password hash.
+    Copying password_hash keeps tests isolated without hashing again.
+    """
+    from models import User
+
+    user = User(username=hashed_user.username)
+    user.password_hash = hashed_user.password_hash
+    return user
+
+
+@pytest.fixture(scope="session")
+def session_username() -> str:
+    """
+    Username for the single user shared by all token-based tests.
+    Tests that need a fresh user per test use unique_username instead.
+    """
+    return f"user_{uuid.uuid4().hex[:12]}"
+
+
+@pytest.fixture(scope="session")
 def password() -> str:
     """Shared password used for test users."""
     return "securepassword123"
 
 
-def register_user(username: str, password: str) -> requests.Response:
+@pytest.fixture(scope="session")
+def endpoints(http) -> SimpleNamespace:
+    """
+    API calls pre-bound to the pooled session and their URL.
+
+    URLs are formatted once per session, so each call only passes what
+    varies (json body, headers). Bodies are small dicts sent via json=;
+    stdlib encoding is negligible next to the HTTP round-trip.
+
+    - register(json=...), login(json=...), events(json=..., headers=...)
+    - rsvp(event_id, json=..., headers=...)
+    """
+
+    def rsvp(event_id: int, **kwargs) -> requests.Response:
+        return http.post(f"{BASE_URL}/api/rsvps/event/{event_id}", **kwargs)
+
+    return SimpleNamespace(
+        register=partial(http.post, f"{BASE_URL}/api/auth/register"),
+        login=partial(http.post, f"{BASE_URL}/api/auth/login"),
+        events=partial(http.post, f"{BASE_URL}/api/events"),
+        rsvp=rsvp,
+    )
+
+
+def register_user(
+    endpoints: SimpleNamespace, username: str, password: str
+) -> requests.Response:
     """
     Helper that calls the registration endpoint.
     Returns the raw Response so tests can assert status + JSON.
     """
-    return requests.post(
-        f"{BASE_URL}/api/auth/register",
-        json={"username": username, "password": password},
-        timeout=5,
-    )
+    return endpoints.register(json={"username": username, "password": password})
 
 
-def login_user(username: str, password: str) -> requests.Response:
+def login_user(
+    endpoints: SimpleNamespace, username: str, password: str
+) -> requests.Response:
     """
     Helper that calls the login endpoint.
     Returns the raw Response so tests can assert status + JSON.
     """
-    return requests.post(
-        f"{BASE_URL}/api/auth/login",
-        json={"username": username, "password": password},
-        timeout=5,
-    )
+    return endpoints.login(json={"username": username, "password": password})
 
 
-@pytest.fixture()
-def auth_token(unique_username, password) -> str:
+def _jwt_exp(token: str) -> float:
     """
-    Creates a user and logs in, returning a valid JWT access token.
-    This keeps tests concise and consistent.
+    Reads the exp claim (unix seconds) from a JWT without verifying it.
+    Only used to decide whether a cached token is still fresh.
     """
-    r = register_user(unique_username, password)
-    assert r.status_code == 201, r.text
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload))["exp"]
 
-    r = login_user(unique_username, password)
-    assert r.status_code == 200, r.text
+
+def _register_for_token(endpoints: SimpleNamespace, username: str, password: str) -> str:
+    """
+    Registers a user and returns its JWT access token in one round-trip
+    (return_token), instead of register + login.
+    """
+    r = endpoints.register(
+        json={"username": username, "password": password, "return_token": True}
+    )
+    assert r.status_code == 201, r.text
 
     token = r.json().get("access_token")
     assert token, r.text
     return token
 
 
-@pytest.fixture()
+def _shared_across_workers(tmp_path_factory, name: str, produce, is_fresh=None):
+    """
+    Runs produce() once per test run and shares its JSON-serialisable result.
+
+    Under pytest-xdist, workers share the value through a small JSON cache
+    in pytest's per-run temp directory, guarded by a FileLock: the first
+    worker produces it, the others reuse it. A cached value for which
+    is_fresh(value) is false is produced again. Without xdist, produce()
+    is simply called.
+    """
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        return produce()
+
+    # The parent of a worker's basetemp is shared by all workers of this run.
+    cache = tmp_path_factory.getbasetemp().parent / f"{name}.json"
+    with FileLock(f"{cache}.lock"):
+        if cache.is_file():
+            cached = json.loads(cache.read_text())
+            if is_fresh is None or is_fresh(cached):
+                return cached
+
+        value = produce()
+        cache.write_text(json.dumps(value))
+    return value
+
+
+@pytest.fixture(scope="session")
+def auth_token(endpoints, session_username, password, tmp_path_factory) -> str:
+    """
+    Returns a valid JWT access token, registering at most one user per run.
+    Under xdist the token is shared by all workers; one that is about to
+    expire is replaced.
+    """
+
+    def register() -> dict:
+        token = _register_for_token(endpoints, session_username, password)
+        return {"token": token, "exp": _jwt_exp(token)}
+
+    cached = _shared_across_workers(
+        tmp_path_factory,
+        "auth_token",
+        register,
+        is_fresh=lambda value: value["exp"] - time.time() > 60,
+    )
+    return cached["token"]
+
+
+@pytest.fixture(scope="session")
 def auth_headers(auth_token) -> dict:
     """
     Standard Authorization header for endpoints protected by JWT.
@@ -116,13 +360,109 @@ def auth_headers(auth_token) -> dict:
     return {"Authorization": f"Bearer {auth_token}"}
 
 
-def create_event(headers: dict | None, payload: dict) -> requests.Response:
+def create_event(
+    endpoints: SimpleNamespace, headers: dict | None, payload: dict
+) -> requests.Response:
     """
     Helper to create events. For authenticated requests, pass headers.
     """
-    return requests.post(
-        f"{BASE_URL}/api/events",
-        json=payload,
-        headers=headers,
-        timeout=5,
-    )
+    return endpoints.events(json=payload, headers=headers)
+
+
+def rsvp_to_event(
+    endpoints: SimpleNamespace, event_id: int, headers: dict | None = None
+) -> requests.Response:
+    """
+    Helper to RSVP (attending=True) to an event, optionally authenticated.
+    """
+    return endpoints.rsvp(event_id, json={"attending": True}, headers=headers)
+
+
+def parallel_post(
+    session: _DefaultTimeoutSession, url: str, items: list[dict]
+) -> list[requests.Response]:
+    """
+    Sends independent POST requests to url concurrently.
+
+    Each item holds the kwargs for one call. Responses come back in the
+    same order as items. The calls are network-bound, so threads are
+    enough to overlap their round-trips; the pool is sized to the batch so
+    no idle threads are started.
+
+    requests.Session is not documented as thread-safe, so every worker
+    thread gets its own Session. Those sessions mount the adapters of
+    `session`, whose urllib3 pools are thread-safe, so connections are
+    still shared. They are not closed, since that would close the shared
+    adapters; the owner of `session` closes them.
+    """
+    if not items:
+        return []
+
+    local = threading.local()
+
+    def post(kwargs: dict) -> requests.Response:
+        if not hasattr(local, "session"):
+            local.session = _DefaultTimeoutSession(timeout=session.default_timeout)
+            for prefix, adapter in session.adapters.items():
+                local.session.mount(prefix, adapter)
+        return local.session.post(url, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+        return list(executor.map(post, items))
+
+
+@pytest.fixture(scope="session")
+def future_iso() -> dict:
+    """
+    ISO-8601 timestamps N days in the future, computed once per session.
+    Keys are the day offsets used by the tests (5, 7, 10, 12).
+    """
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return {days: (now + timedelta(days=days)).isoformat() for days in (5, 7, 10, 12)}
+
+
+@pytest.fixture(scope="session")
+def prebuilt_events(http, auth_headers, future_iso, tmp_path_factory) -> dict:
+    """
+    Creates the events shared by RSVP tests in one concurrent batch,
+    once per run (under xdist the ids are shared by all workers).
+
+    Returns a mapping of name -> event id:
+    - "public": public event, anyone may RSVP
+    - "private": non-public event, RSVP requires auth
+    """
+    payloads = {
+        "public": {
+            "title": "RSVP Public Event",
+            "description": "RSVP integration test",
+            "date": future_iso[10],
+            "location": "Hamburg",
+            "capacity": 50,
+            "is_public": True,
+            "requires_admin": False,
+        },
+        "private": {
+            "title": "Protected Event",
+            "description": "Non-public event",
+            "date": future_iso[12],
+            "location": "Munich",
+            "capacity": 10,
+            "is_public": False,
+            "requires_admin": False,
+        },
+    }
+
+    def create_all() -> dict:
+        responses = parallel_post(
+            http,
+            f"{BASE_URL}/api/events",
+            [{"json": payload, "headers": auth_headers} for payload in payloads.values()],
+        )
+
+        events = {}
+        for name, r in zip(payloads, responses):
+            assert r.status_code == 201, r.text
+            events[name] = r.json()["id"]
+        return events
+
+    return _shared_across_workers(tmp_path_factory, "prebuilt_events", create_all)
@@ -0,0 +1,30 @@
+"""
+In-process tests for the Flask application factory.
+
+These tests:
+- Use the shared session-scoped `app` fixture (in-memory SQLite)
+- Do NOT require a running server or perform real HTTP requests
+"""
+
+
+def test_app_uses_in_memory_database_with_tables(app):
+    """
+    The test app must never touch events.db, and create_app()
+    must have created the tables so queries work inside an app context.
+    """
+    from models import User
+
+    assert app.config["SQLALCHEMY_DATABASE_URI"] == "sqlite:///:memory:"
+
+    with app.app_context():
+        assert User.query.count() == 0
+
+
+def test_app_health_endpoint_via_test_client(app):
+    """
+    Blueprints and routes are registered on the shared app instance.
+    """
+    r = app.test_client().get("/api/health")
+
+    assert r.status_code == 200
+    assert r.get_json()["status"] == "healthy"
@@ -11,25 +11,39 @@ They only validate pure Python logic inside the models.
 
 from datetime import datetime, timezone
 
-from models import User, Event, RSVP
+import pytest
+
+# Cheap password hashing for the whole module (see conftest.fast_password_hashing).
+pytestmark = pytest.mark.usefixtures("fast_password_hashing")
+
+
+@pytest.fixture(scope="module")
+def models_mod():
+    """
+    The models module, imported only when a test here actually runs.
+    Keeps collection (and filtered runs like -k) free of the SQLAlchemy import.
+    """
+    import models
+
+    return models
 
 
 # ============================================================
 # User Model Tests
 # ============================================================
 
-def test_user_password_hashing_behaves_correctly():
+def test_user_password_hashing_behaves_correctly(hashed_user_copy):
     """
     Verifies that:
     - Passwords are hashed (not stored in plain text)
     - Correct password validates successfully
     - Incorrect password fails validation
-    """
 
-    user = User(username="alice")
+    The hash comes from the module-scoped fixture ("secret123"),
+    so it is computed once for this module.
+    """
 
-    # Hash and store password
-    user.set_password("secret123")
+    user = hashed_user_copy
 
     # Password hash should exist
     assert user.password_hash is not None
@@ -44,14 +58,15 @@ def test_user_password_hashing_behaves_correctly():
     assert user.check_password("wrong") is False
 
 
-def test_user_to_dict_excludes_password_hash():
+def test_user_to_dict_excludes_password_hash(models_mod, hashed_user):
     """
     Ensures that sensitive fields (like password_hash)
     are not exposed via the public serialization method.
     """
 
-    user = User(username="bob", is_admin=False)
-    user.set_password("pw")
+    user = models_mod.User(username="bob", is_admin=False)
+    # Reuse the module's hash instead of hashing again.
+    user.password_hash = hashed_user.password_hash
 
     payload = user.to_dict()
 
@@ -67,25 +82,38 @@ def test_user_to_dict_excludes_password_hash():
 # Event Model Tests
 # ============================================================
 
-def test_event_to_dict_basic_fields():
+@pytest.fixture(scope="module")
+def event_factory(models_mod):
     """
-    Verifies that Event.to_dict():
-    - Returns expected public fields
-    - Calculates RSVP count correctly
-    - Returns empty attendees list when no RSVPs exist
+    Builds in-memory Event objects from shared default fields.
+    Pass keyword overrides for the fields a test cares about.
     """
-
-    event = Event(
+    base_kwargs = dict(
         title="Test Event",
         description="Desc",
         date=datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
         location="Berlin",
-        capacity=50,
         is_public=True,
         requires_admin=False,
         created_by=None,
     )
 
+    def make(**overrides):
+        return models_mod.Event(**{**base_kwargs, **overrides})
+
+    return make
+
+
+def test_event_to_dict_basic_fields(event_factory):
+    """
+    Verifies that Event.to_dict():
+    - Returns expected public fields
+    - Calculates RSVP count correctly
+    - Returns empty attendees list when no RSVPs exist
+    """
+
+    event = event_factory(capacity=50)
+
     # Simulate no RSVPs without using the database.
     # We directly attach an empty list to the relationship.
     event.rsvps = []
@@ -98,7 +126,7 @@ def test_event_to_dict_basic_fields():
     assert payload["attendees"] == []
 
 
-def test_event_to_dict_counts_only_user_attendees():
+def test_event_to_dict_counts_only_user_attendees(models_mod, event_factory):
     """
     Ensures that:
     - rsvp_count counts ALL RSVP entries
@@ -109,23 +137,14 @@ def test_event_to_dict_counts_only_user_attendees():
     SQLAlchemy-mapped instances (RSVP), not plain Python objects.
     """
 
-    event = Event(
-        title="RSVP Test",
-        description="Desc",
-        date=datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
-        location="Berlin",
-        capacity=10,
-        is_public=True,
-        requires_admin=False,
-        created_by=None,
-    )
+    event = event_factory(title="RSVP Test", capacity=10)
 
     # Pure in-memory objects: no DB session, no commit, no HTTP.
     event.rsvps = [
-        RSVP(user_id=1, attending=True, event_id=1),
-        RSVP(user_id=2, attending=False, event_id=1),
-        RSVP(user_id=None, attending=True, event_id=1),  # anonymous attendee
-        RSVP(user_id=3, attending=True, event_id=1),
+        models_mod.RSVP(user_id=1, attending=True, event_id=1),
+        models_mod.RSVP(user_id=2, attending=False, event_id=1),
+        models_mod.RSVP(user_id=None, attending=True, event_id=1),  # anonymous attendee
+        models_mod.RSVP(user_id=3, attending=True, event_id=1),
     ]
 
     payload = event.to_dict()